@@ -27,21 +27,60 @@
 # -----------------------------------------------
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 import json
 import csv
 import os
+import sys
+import time
 from datetime import datetime
 
+try:
+    import orjson  # C-accelerated JSON; persistence is the app's hottest path
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # optional vectorized search for very large task lists
+except ImportError:
+    np = None
+
 TASKS_FILE = "tasks.json"
+LOG_FILE = "tasks.jsonl"
 DEFAULT_CATEGORIES = ["Work", "Personal", "Urgent"]
 
+# Mutations land in the append log immediately; the full snapshot is only
+# rewritten on exit, on compaction, or by the periodic safety flush below.
+_dirty = False
+FLUSH_INTERVAL_S = 30.0
+
+# Category index kept in sync with the task list (see rebuild_category_index).
+# Lets "view by category" and stats read pre-grouped buckets instead of
+# rescanning every task.
+_by_category: Dict[str, List["Task"]] = defaultdict(list)
+_done_by_category: Counter = Counter()
+
+# Struct-of-arrays mirrors of the task list (position i matches tasks[i]).
+# Whole-list scans that only need the category or the completed flag walk
+# these flat lists instead of chasing Task objects.
+_cat_list: List[str] = []
+_done_list: List[bool] = []
+
+# id -> Task map for O(1) lookups without scanning the list
+_by_id: Dict[int, "Task"] = {}
+
+# Lazily built array of search blobs for the NumPy fast path; dropped to
+# None by any mutation and rebuilt on the next large search.
+_np_blobs = None
+NP_SEARCH_MIN_TASKS = 10_000
+
 # ----------------------------
 # Data model
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
@@ -50,6 +89,24 @@ class Task:
     completed: bool = False
     created_at: str = ""
     updated_at: str = ""
+    # Lowercase search cache; declared as fields so they live in __slots__.
+    # Filled by __post_init__, never persisted.
+    _title_lc: str = field(default="", repr=False, compare=False)
+    _desc_lc: str = field(default="", repr=False, compare=False)
+    _cat_lc: str = field(default="", repr=False, compare=False)
+    _search_blob: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.refresh_search_cache()
+
+    def refresh_search_cache(self) -> None:
+        # Cached lowercase fields so search doesn't re-lower every task per query
+        self._title_lc = self.title.lower()
+        self._desc_lc = self.description.lower()
+        self._cat_lc = self.category.lower()
+        # One haystack per task so search does a single substring scan;
+        # the NUL separator prevents matches spanning field boundaries
+        self._search_blob = f"{self._cat_lc}\x00{self._title_lc}\x00{self._desc_lc}"
 
     def mark_completed(self) -> None:
         self.completed = True
@@ -59,8 +116,18 @@ class Task:
         self.completed = False
         self.updated_at = now_iso()
 
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+    def as_plain_dict(self) -> Dict[str, Any]:
+        # Hand-written literal: asdict() deep-copies every field and is
+        # many times slower, and save_tasks runs on every mutation.
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Task":
@@ -80,8 +147,26 @@ class Task:
 # Utilities
 # ----------------------------
 
+def rebuild_indexes(tasks: List[Task]) -> None:
+    global _np_blobs
+    _np_blobs = None
+    _by_category.clear()
+    _done_by_category.clear()
+    _cat_list.clear()
+    _done_list.clear()
+    _by_id.clear()
+    for t in tasks:
+        _by_category[t.category].append(t)
+        if t.completed:
+            _done_by_category[t.category] += 1
+        _cat_list.append(t.category)
+        _done_list.append(t.completed)
+        _by_id[t.id] = t
+
 def now_iso() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Same "YYYY-MM-DD HH:MM:SS" output as strftime, but isoformat is a pure
+    # C path with no format-string parsing
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
 
 def ensure_tasks_file() -> None:
     if not os.path.exists(TASKS_FILE):
@@ -90,28 +175,99 @@ def ensure_tasks_file() -> None:
 
 def load_tasks() -> List[Task]:
     ensure_tasks_file()
+    loads = orjson.loads if orjson is not None else json.loads
+    by_id: Dict[int, Task] = {}
     try:
-        with open(TASKS_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-            if not isinstance(raw, list):
-                return []
-            return [Task.from_dict(item) for item in raw]
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+        # Binary mode + one read(): a single syscall for the whole snapshot,
+        # no text-wrapper chunking. Both json and orjson parse bytes directly.
+        with open(TASKS_FILE, "rb") as f:
+            raw_bytes = f.read(os.path.getsize(TASKS_FILE))
+        raw = loads(raw_bytes) if raw_bytes else []
+        if isinstance(raw, list):
+            for item in raw:
+                t = Task.from_dict(item)
+                by_id[t.id] = t
+    except (ValueError, FileNotFoundError):
+        # orjson and stdlib json both raise ValueError subclasses on bad JSON
+        pass
+    # Replay mutations logged since the last snapshot
+    if os.path.exists(LOG_FILE):
+        with open(LOG_FILE, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = loads(line)
+                except ValueError:
+                    continue  # truncated tail from an interrupted write
+                t = Task.from_dict(record.get("task", {}))
+                if record.get("op") == "del":
+                    by_id.pop(t.id, None)
+                else:
+                    by_id[t.id] = t
+    tasks = list(by_id.values())
+    rebuild_indexes(tasks)
+    return tasks
 
 def save_tasks(tasks: List[Task]) -> None:
-    with open(TASKS_FILE, "w", encoding="utf-8") as f:
-        json.dump([t.to_dict() for t in tasks], f, ensure_ascii=False, indent=2)
+    # Full snapshot; the per-mutation path is append_op. Clearing the log
+    # afterwards keeps snapshot + log a consistent pair.
+    data = [t.as_plain_dict() for t in tasks]
+    # 128 KiB buffer instead of the default 8 KiB: far fewer write() syscalls
+    # on big snapshots, especially for json.dump's many small writes.
+    # Written to a sibling temp file and os.replace'd so a crash mid-write
+    # can never leave a truncated tasks.json behind.
+    tmp = TASKS_FILE + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb", buffering=131072) as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(tmp, "w", encoding="utf-8", buffering=131072) as f:
+            json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, TASKS_FILE)
+    if os.path.exists(LOG_FILE):
+        os.remove(LOG_FILE)
+    global _dirty
+    _dirty = False
+
+def append_op(op: str, task: Task) -> None:
+    # One small append per mutation instead of rewriting the whole snapshot:
+    # O(1) bytes written per add/edit/toggle/delete.
+    global _dirty, _np_blobs
+    _dirty = True
+    _np_blobs = None  # any mutation invalidates the vectorized search index
+    record = {"op": op, "task": task.as_plain_dict()}
+    if orjson is not None:
+        payload = orjson.dumps(record)
+    else:
+        payload = json.dumps(record, ensure_ascii=False).encode("utf-8")
+    with open(LOG_FILE, "ab") as f:
+        f.write(payload + b"\n")
+
+def compact_log(tasks: List[Task]) -> None:
+    # Fold the log back into the snapshot once it outgrows the live data
+    # (roughly 2x the snapshot), so replay stays cheap on the next launch.
+    try:
+        log_size = os.path.getsize(LOG_FILE)
+    except OSError:
+        return
+    snap_size = os.path.getsize(TASKS_FILE) if os.path.exists(TASKS_FILE) else 0
+    if log_size > 2 * snap_size:
+        save_tasks(tasks)
 
 def export_to_csv(tasks: List[Task], filename: str = "tasks_export.csv") -> None:
     fields = ["id", "title", "description", "category", "completed", "created_at", "updated_at"]
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        for t in tasks:
-            row = t.to_dict()
-            row["completed"] = "Yes" if t.completed else "No"
-            writer.writerow(row)
+    # Stream tuples straight to the writer: no per-task dict, no asdict deepcopy,
+    # and a big buffer so csv's many small writes batch into few syscalls.
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 17) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(
+            (t.id, t.title, t.description, t.category,
+             "Yes" if t.completed else "No", t.created_at, t.updated_at)
+            for t in tasks
+        )
 
 def next_task_id(tasks: List[Task]) -> int:
     return (max((t.id for t in tasks), default=0) + 1) if tasks else 1
@@ -130,20 +286,25 @@ def input_optional(prompt: str, current: Optional[str] = None) -> str:
 def input_choice(prompt: str, choices: List[str]) -> int:
     # Returns 1-based index
     while True:
-        val = input(prompt).strip()
-        if val.isdigit():
-            idx = int(val)
-            if 1 <= idx <= len(choices):
-                return idx
+        # int() handles stripping and sign itself; one pass over the input
+        # instead of isdigit() followed by int()
+        try:
+            idx = int(input(prompt))
+        except ValueError:
+            idx = 0
+        if 1 <= idx <= len(choices):
+            return idx
         print(f"Please enter a number between 1 and {len(choices)}.")
 
 def input_int_in_range(prompt: str, min_val: int, max_val: int) -> int:
     while True:
-        s = input(prompt).strip()
-        if s.isdigit():
-            v = int(s)
-            if min_val <= v <= max_val:
-                return v
+        try:
+            v = int(input(prompt))
+        except ValueError:
+            print(f"Enter a number between {min_val} and {max_val}.")
+            continue
+        if min_val <= v <= max_val:
+            return v
         print(f"Enter a number between {min_val} and {max_val}.")
 
 def confirm(prompt: str) -> bool:
@@ -174,44 +335,26 @@ def print_tasks_table(tasks: List[Task]) -> None:
 
 def print_table(headers: List[str], rows: List[List[str]]) -> None:
     # Simple fixed-width table (no external libs)
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-
-    def line(sep_left="│", sep_mid="│", sep_right="│"):
-        parts = []
-        for i, h in enumerate(headers):
-            parts.append(f" {h.ljust(col_widths[i])} ")
-        print(sep_left + sep_mid.join(parts) + sep_right)
-
-    def hrule(sep_left="┌", sep_mid="┬", sep_right="┐", fill="─"):
-        parts = []
-        for w in col_widths:
-            parts.append(fill * (w + 2))
-        print(sep_left + sep_mid.join(parts) + sep_right)
-
-    def hrule_mid(sep_left="├", sep_mid="┼", sep_right="┤", fill="─"):
-        parts = []
-        for w in col_widths:
-            parts.append(fill * (w + 2))
-        print(sep_left + sep_mid.join(parts) + sep_right)
-
-    def hrule_bottom(sep_left="└", sep_mid="┴", sep_right="┘", fill="─"):
-        parts = []
-        for w in col_widths:
-            parts.append(fill * (w + 2))
-        print(sep_left + sep_mid.join(parts) + sep_right)
-
-    hrule()
-    line()
-    hrule_mid()
-    for row in rows:
-        parts = []
-        for i, cell in enumerate(row):
-            parts.append(f" {str(cell).ljust(col_widths[i])} ")
-        print("│" + "│".join(parts) + "│")
-    hrule_bottom()
+    # Stringify each cell once, reused for both width computation and render
+    srows = [[str(cell) for cell in row] for row in rows]
+    col_widths = [
+        max(len(h), *(len(r[i]) for r in srows)) if srows else len(h)
+        for i, h in enumerate(headers)
+    ]
+
+    def hrule(sep_left: str, sep_mid: str, sep_right: str, fill: str = "─") -> str:
+        return sep_left + sep_mid.join(fill * (w + 2) for w in col_widths) + sep_right
+
+    def line(cells: List[str]) -> str:
+        parts = (f" {cell.ljust(col_widths[i])} " for i, cell in enumerate(cells))
+        return "│" + "│".join(parts) + "│"
+
+    # Assemble the whole table and emit it in one write: one stdout-lock
+    # acquisition and one syscall instead of ~2N separate print() calls.
+    out = [hrule("┌", "┬", "┐"), line(headers), hrule("├", "┼", "┤")]
+    out.extend(line(row) for row in srows)
+    out.append(hrule("└", "┴", "┘"))
+    sys.stdout.write("\n".join(out) + "\n")
 
 def pause() -> None:
     input("\nPress Enter to continue...")
@@ -233,23 +376,14 @@ def choose_category(existing_categories: List[str]) -> str:
     return cats[choice - 1]
 
 def distinct_categories(categories: List[str]) -> List[str]:
-    seen = set()
-    ordered = []
-    for c in categories:
-        c = c.strip()
-        if not c:
-            continue
-        if c not in seen:
-            seen.add(c)
-            ordered.append(c)
-    return ordered
+    # dict preserves insertion order, so fromkeys dedupes in one C-level pass
+    return list(dict.fromkeys(s for s in (c.strip() for c in categories) if s))
 
 def add_task(tasks: List[Task]) -> None:
     print_header("Add a new task")
     title = input_nonempty("Title: ")
     description = input_nonempty("Description: ")
-    user_categories = [t.category for t in tasks]
-    category = choose_category(user_categories)
+    category = choose_category(_cat_list)
     task = Task(
         id=next_task_id(tasks),
         title=title,
@@ -260,7 +394,12 @@ def add_task(tasks: List[Task]) -> None:
         updated_at=now_iso(),
     )
     tasks.append(task)
-    save_tasks(tasks)
+    _by_category[task.category].append(task)
+    _cat_list.append(task.category)
+    _done_list.append(task.completed)
+    _by_id[task.id] = task
+    append_op("add", task)
+    compact_log(tasks)
     print("\nTask added successfully.")
 
 def view_tasks(tasks: List[Task]) -> None:
@@ -269,42 +408,56 @@ def view_tasks(tasks: List[Task]) -> None:
 
 def view_by_category(tasks: List[Task]) -> None:
     print_header("View tasks by category")
-    cats = distinct_categories([t.category for t in tasks]) or ["Uncategorized"]
+    cats = distinct_categories(_cat_list) or ["Uncategorized"]
     for i, c in enumerate(cats, start=1):
         print(f"{i}. {c}")
     choice = input_int_in_range(f"Select 1-{len(cats)}: ", 1, len(cats))
     chosen = cats[choice - 1]
-    filtered = [t for t in tasks if t.category == chosen]
+    filtered = _by_category.get(chosen, [])
     print_header(f"Category: {chosen}")
     print_tasks_table(filtered)
 
+def _np_search(tasks: List[Task], query: str) -> List[Task]:
+    # Vectorized fast path for very large lists: one C loop over a string
+    # array instead of a Python-level check per task.
+    global _np_blobs
+    if _np_blobs is None:
+        _np_blobs = np.array([t._search_blob for t in tasks])
+    mask = np.char.find(_np_blobs, query) >= 0
+    return [tasks[i] for i in np.flatnonzero(mask)]
+
 def search_tasks(tasks: List[Task]) -> None:
     print_header("Search tasks")
     query = input_nonempty("Enter keyword (title/description/category): ").lower()
-    results = [t for t in tasks if query in t.title.lower() or query in t.description.lower() or query in t.category.lower()]
+    if np is not None and len(tasks) >= NP_SEARCH_MIN_TASKS:
+        results = _np_search(tasks, query)
+    else:
+        results = [t for t in tasks if query in t._search_blob]
     print_header(f"Results for: {query}")
     print_tasks_table(results)
 
-def select_task(tasks: List[Task], prompt: str = "Select task by #") -> Optional[Task]:
+def select_task_index(tasks: List[Task], prompt: str = "Select task by #") -> Optional[int]:
+    # Returns a 0-based list index so callers can update the parallel
+    # index structures without re-searching the list for the task.
     if not tasks:
         print("No tasks available.")
         return None
     print_tasks_table(tasks)
     idx = input_int_in_range(f"{prompt} (1-{len(tasks)}): ", 1, len(tasks))
-    return tasks[idx - 1]
+    return idx - 1
 
 def edit_task(tasks: List[Task]) -> None:
     print_header("Edit a task")
-    task = select_task(tasks, "Choose a task to edit")
-    if not task:
+    idx = select_task_index(tasks, "Choose a task to edit")
+    if idx is None:
         return
+    task = tasks[idx]
     print("\nLeave a field empty to keep the current value.")
     new_title = input_optional(f"New title [{task.title}]: ", current=task.title).strip()
     new_desc = input_optional(f"New description [{task.description}]: ", current=task.description).strip()
 
     print("\nCategory options:")
-    user_categories = [t.category for t in tasks]
-    cats = distinct_categories(user_categories + DEFAULT_CATEGORIES)
+    cats = distinct_categories(_cat_list + DEFAULT_CATEGORIES)
     for i, c in enumerate(cats, start=1):
         print(f"{i}. {c}")
     print(f"{len(cats) + 1}. Keep current ({task.category})")
@@ -320,33 +473,63 @@ def edit_task(tasks: List[Task]) -> None:
 
     task.title = new_title or task.title
     task.description = new_desc or task.description
-    task.category = new_cat or task.category
+    new_cat = new_cat or task.category
+    if new_cat != task.category:
+        bucket = _by_category[task.category]
+        bucket.remove(task)
+        if not bucket:
+            del _by_category[task.category]
+        if task.completed:
+            _done_by_category[task.category] -= 1
+            _done_by_category[new_cat] += 1
+        _by_category[new_cat].append(task)
+        _cat_list[idx] = new_cat
+        task.category = new_cat
     task.updated_at = now_iso()
-    save_tasks(tasks)
+    task.refresh_search_cache()
+    append_op("upd", task)
+    compact_log(tasks)
     print("\nTask updated successfully.")
 
 def toggle_complete_task(tasks: List[Task]) -> None:
     print_header("Mark task completed/uncompleted")
-    task = select_task(tasks, "Choose a task to toggle status")
-    if not task:
+    idx = select_task_index(tasks, "Choose a task to toggle status")
+    if idx is None:
         return
+    task = tasks[idx]
     if task.completed:
         task.mark_uncompleted()
+        _done_by_category[task.category] -= 1
         print(f"\nMarked as NOT completed: {task.title}")
     else:
         task.mark_completed()
+        _done_by_category[task.category] += 1
         print(f"\nMarked as completed: {task.title}")
-    save_tasks(tasks)
+    _done_list[idx] = task.completed
+    # A toggle is a one-record log append, not a full-file rewrite
+    append_op("upd", task)
+    compact_log(tasks)
 
 def delete_task(tasks: List[Task]) -> None:
     print_header("Delete a task")
-    task = select_task(tasks, "Choose a task to delete")
-    if not task:
+    idx = select_task_index(tasks, "Choose a task to delete")
+    if idx is None:
         return
+    task = tasks[idx]
     print(f"\nYou are about to delete: '{task.title}' (Category: {task.category})")
     if confirm("Are you sure"):
-        tasks.remove(task)
-        save_tasks(tasks)
+        tasks.pop(idx)
+        _cat_list.pop(idx)
+        _done_list.pop(idx)
+        _by_id.pop(task.id, None)
+        bucket = _by_category[task.category]
+        bucket.remove(task)
+        if not bucket:
+            del _by_category[task.category]
+        if task.completed:
+            _done_by_category[task.category] -= 1
+        append_op("del", task)
+        compact_log(tasks)
         print("Task deleted.")
     else:
         print("Deletion cancelled.")
@@ -354,18 +537,15 @@ def delete_task(tasks: List[Task]) -> None:
 def show_stats(tasks: List[Task]) -> None:
     print_header("Task stats")
     total = len(tasks)
-    done = sum(1 for t in tasks if t.completed)
+    done = sum(_done_list)
     pending = total - done
-    cats = distinct_categories([t.category for t in tasks])
     print(f"Total tasks: {total}")
     print(f"Completed: {done}")
     print(f"Pending: {pending}")
     print("\nBy category:")
-    if cats:
-        for c in cats:
-            c_total = sum(1 for t in tasks if t.category == c)
-            c_done = sum(1 for t in tasks if t.category == c and t.completed)
-            print(f"- {c}: {c_done}/{c_total} done")
+    if _by_category:
+        for c, bucket in _by_category.items():
+            print(f"- {c}: {_done_by_category[c]}/{len(bucket)} done")
     else:
         print("- None")
 
@@ -379,8 +559,25 @@ def export_tasks_menu(tasks: List[Task]) -> None:
 # Main menu / App loop
 # ----------------------------
 
+class TasksProxy:
+    # Defers load_tasks() until a menu action actually needs the list, so
+    # launching and exiting straight away never touches the task files.
+
+    def __init__(self) -> None:
+        self._tasks: Optional[List[Task]] = None
+
+    def get(self) -> List[Task]:
+        if self._tasks is None:
+            self._tasks = load_tasks()
+        return self._tasks
+
+    @property
+    def loaded(self) -> bool:
+        return self._tasks is not None
+
 def main() -> None:
-    tasks = load_tasks()
+    proxy = TasksProxy()
+    last_flush = time.monotonic()
     while True:
         print_header("Personal To-Do List")
         print("1. Add task")
@@ -396,40 +593,46 @@ def main() -> None:
         choice = input("Choose an option: ").strip()
 
         if choice == "1":
-            add_task(tasks)
+            add_task(proxy.get())
             pause()
         elif choice == "2":
-            view_tasks(tasks)
+            view_tasks(proxy.get())
             pause()
         elif choice == "3":
-            view_by_category(tasks)
+            view_by_category(proxy.get())
             pause()
         elif choice == "4":
-            search_tasks(tasks)
+            search_tasks(proxy.get())
             pause()
         elif choice == "5":
-            edit_task(tasks)
+            edit_task(proxy.get())
             pause()
         elif choice == "6":
-            toggle_complete_task(tasks)
+            toggle_complete_task(proxy.get())
             pause()
         elif choice == "7":
-            delete_task(tasks)
+            delete_task(proxy.get())
             pause()
         elif choice == "8":
-            show_stats(tasks)
+            show_stats(proxy.get())
             pause()
         elif choice == "9":
-            export_tasks_menu(tasks)
+            export_tasks_menu(proxy.get())
             pause()
         elif choice == "0":
             print("\nSaving and exiting... Bye!")
-            save_tasks(tasks)
+            if proxy.loaded and _dirty:
+                save_tasks(proxy.get())
             break
         else:
             print("Invalid choice. Please try again.")
             pause()
 
+        # Safety flush: fold the log into the snapshot every 30 s at most
+        if proxy.loaded and _dirty and time.monotonic() - last_flush >= FLUSH_INTERVAL_S:
+            save_tasks(proxy.get())
+            last_flush = time.monotonic()
+
 if __name__ == "__main__":
     main()
 